@@ -12,8 +12,26 @@ Run this on your PC to:
 import subprocess
 import os
 import json
+import functools
+import gzip
+import hashlib
+import html
+import itertools
+import logging
+import shlex
+import shutil
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, jsonify, request
+
+try:
+    import paramiko
+except ImportError:
+    paramiko = None  # Fall back to the multiplexed OpenSSH client
 
 app = Flask(__name__)
 
@@ -24,51 +42,337 @@ CONFIG = {
     "pi_project_path": "~/powerball_simulator",
     "dev_panel_port": 5050,
     "git_remote": "origin",
-    "git_branch": "master"
+    "git_branch": "master",
+    "console_log_level": "WARNING"  # Set to "INFO" to echo every log entry to the terminal
 }
 
-# Log storage
-logs = []
+# SSH multiplexing - reuse one authenticated connection to the Pi for every command
+SSH_OPTS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=/tmp/pb-ssh-%r@%h:%p",
+    "-o", "ControlPersist=600s",
+    "-o", "ConnectTimeout=5",
+    "-o", "ServerAliveInterval=5",
+    "-o", "ServerAliveCountMax=2",
+]
+SSH_TARGET = f'{CONFIG["pi_user"]}@{CONFIG["pi_host"]}'
+SSH_BASE = ["ssh", *SSH_OPTS, SSH_TARGET]
+
+# Kill only powerball-related processes (by path), clean up screens, then start fresh
+PI_RESTART_SCRIPT = f"pkill -f 'powerball_simulator/main.py' 2>/dev/null; screen -ls | grep powerball | cut -d. -f1 | awk '{{print $1}}' | xargs -r -I {{}} screen -S {{}} -X quit 2>/dev/null; screen -wipe 2>/dev/null; cd {CONFIG['pi_project_path']} && screen -dmS powerball bash -c 'source venv/bin/activate && python main.py'"
+
+# Fixed Pi commands, built once
+PI_PULL_SCRIPT = f'cd {CONFIG["pi_project_path"]} && git pull'
+PI_STATUS_SCRIPT = "screen -ls | grep powerball; ps aux | grep python | grep -v grep | head -3"
+
+# Started alongside the local push: fetch until upstream contains $SHA (it may already have
+# moved past it), backing off 1s -> 4s between fetches and giving up after ~60s; then
+# fast-forward and restart. Run as `SHA=<sha>; STOP=<path>; <script>` - creating $STOP
+# (see PI_CANCEL_DEPLOY_SCRIPT) makes it give up early, e.g. when the push failed.
+PI_AWAIT_DEPLOY_SCRIPT = (
+    f'cd {CONFIG["pi_project_path"]} && waited=0 && delay=1 && '
+    'until git fetch -q && git merge-base --is-ancestor "$SHA" @{u} 2>/dev/null; do '
+    'if [ -e "$STOP" ]; then rm -f "$STOP"; echo "Deploy cancelled" >&2; exit 1; fi; '
+    '[ $waited -lt 60 ] || exit 1; sleep $delay; waited=$((waited+delay)); '
+    '[ $delay -ge 4 ] || delay=$((delay*2)); done && '
+    f'git merge -q --ff-only @{{u}} && ({PI_RESTART_SCRIPT})'
+)
+PI_CANCEL_DEPLOY_SCRIPT = 'touch "$STOP"'
+
+# Stage, commit (only if something is staged) and push in one shell.
+# repo/message/remote/branch are passed as $1-$4, never interpolated.
+GIT_DEPLOY_SCRIPT = 'cd "$1" && git add -A && { git diff --cached --quiet || git commit -m "$2"; } && git push "$3" "$4"'
+
+# Stage and commit (only if something is staged), then print the commit to deploy and the
+# number of commits not yet pushed ("?" without an upstream) - 0 means nothing to push
+GIT_COMMIT_SCRIPT = (
+    'cd "$1" && git add -A && { git diff --cached --quiet || git commit -q -m "$2"; } && '
+    'git rev-parse HEAD && { git rev-list --count @{u}..HEAD 2>/dev/null || echo "?"; }'
+)
+
+# Popen only takes the posix_spawn (vfork+exec) fast path with close_fds=False, no cwd and an
+# absolute executable - safe on POSIX since Python opens every fd non-inheritable
+SPAWN_CLOSE_FDS = os.name != "posix"
+
+# Bytes of stdout/stderr kept per command - the rest is drained and discarded
+OUTPUT_LIMIT = 8192
+
+# Shared Paramiko connection to the Pi (only used when paramiko is installed)
+ssh_client = None
+ssh_client_lock = threading.Lock()
+paramiko_failed = False  # Set once Paramiko can't log in - use the OpenSSH client from then on
+
+# Background deploys - one worker so deploys never overlap
+deploy_executor = ThreadPoolExecutor(max_workers=1)
+# Runs the Pi side of a deploy while the deploy worker pushes
+remote_executor = ThreadPoolExecutor(max_workers=1)
+deploys = {}
+deploys_lock = threading.Lock()
+last_deploy_id = 0
+DEPLOYS_KEPT = 10  # Finished deploys whose status can still be fetched
+
+# One operation on the local repo at a time - a deploy holds it from commit to restart,
+# git endpoints refuse (409) while it's taken rather than trip over .git/index.lock
+git_lock = threading.Lock()
+
+# Log entry markup, rendered once per entry so clients just insert it
+LOG_ENTRY_HTML = '<div class="log-entry"><span class="log-time">[{time}]</span> <span class="log-{level}">{message}</span></div>'
+
+# Terminal logging (opt-in detail; the browser log view always gets everything)
+logger = logging.getLogger("devpanel")
+LOG_LEVELS = {"info": logging.INFO, "success": logging.INFO, "error": logging.ERROR}
+
+# Log storage (oldest entries drop off automatically)
+logs = deque(maxlen=100)
+logs_version = 0  # Bumped on every new entry; doubles as the entry id and ETag
+logs_changed = threading.Condition()  # Wakes /api/logs/stream listeners
+
+# Each open log stream holds a server thread for as long as its tab is open. Past this
+# many, new streams get a 503 and the page polls instead - keep it well under SERVER_THREADS
+# so API calls always have threads left.
+SERVER_THREADS = 8
+MAX_LOG_STREAMS = 4
+open_log_streams = 0
+open_log_streams_lock = threading.Lock()
 
 def add_log(message, level="info"):
     """Add a log entry."""
-    entry = {
-        "time": datetime.now().strftime("%H:%M:%S"),
-        "level": level,
-        "message": message
-    }
-    logs.append(entry)
-    if len(logs) > 100:
-        logs.pop(0)
-    print(f"[{entry['time']}] [{level.upper()}] {message}")
-
-def run_command(cmd, cwd=None, capture=True):
-    """Run a shell command and return output."""
-    add_log(f"Running: {cmd}")
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            cwd=cwd,
-            capture_output=capture,
-            text=True,
-            timeout=60
+    global logs_version
+    with logs_changed:
+        logs_version += 1
+        entry = {
+            "id": logs_version,
+            "time": datetime.now().strftime("%H:%M:%S"),
+            "level": level,
+            "message": message
+        }
+        # Encode newlines so the fragment stays on one SSE data: line
+        entry["html"] = LOG_ENTRY_HTML.format(
+            time=entry["time"],
+            level=html.escape(level),
+            message=html.escape(message).replace("\r", "&#13;").replace("\n", "&#10;")
         )
-        if result.returncode == 0:
-            add_log(f"Success: {result.stdout[:200] if result.stdout else 'OK'}")
-            return True, result.stdout
+        logs.append(entry)
+        logs_changed.notify_all()
+    logger.log(LOG_LEVELS.get(level, logging.INFO), "%s", message)
+
+def read_capped(stream, chunks, limit=OUTPUT_LIMIT):
+    """Drain a pipe, keeping only its first `limit` bytes in chunks."""
+    kept = 0
+    for block in iter(lambda: stream.read(4096), b""):
+        if kept < limit:
+            chunks.append(block[:limit - kept])
+            kept += len(chunks[-1])
+    stream.close()
+
+def logs_since(since):
+    """Return (version, full, entries) for a client that has seen entries up to `since`.
+
+    Entry ids are consecutive, so the unseen entries are a tail slice of the deque.
+    full is True (and entries is everything) on first load or after a panel restart.
+    """
+    with logs_changed:
+        version = logs_version
+        if since == 0 or since > version or not logs:
+            return version, True, list(logs)
+        skip = max(0, since - logs[0]["id"] + 1)
+        return version, False, list(itertools.islice(logs, skip, None))
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name):
+    """Absolute path for a command name (falls back to the bare name if it isn't on PATH)."""
+    return shutil.which(name) or name
+
+def spawn_argv(cmd):
+    """cmd with its program resolved to an absolute path, so Popen can use posix_spawn."""
+    return [resolve_executable(cmd[0]), *cmd[1:]]
+
+def run_command(cmd, cwd=None, capture=True, timeout=30):
+    """Run a command (argv list, no shell) and return output.
+
+    timeout is in seconds - keep it short for quick probes, long for push/deploy.
+    Only the first OUTPUT_LIMIT bytes of stdout/stderr are kept.
+    Prefer `git -C <path>` / `cd "$1"` over cwd - a cwd forces the slower fork+exec.
+    """
+    add_log(f"Running: {shlex.join(cmd)}")
+    try:
+        pipe = subprocess.PIPE if capture else None
+        proc = subprocess.Popen(spawn_argv(cmd), cwd=cwd, stdout=pipe, stderr=pipe,
+                                close_fds=SPAWN_CLOSE_FDS)
+        out_chunks, err_chunks = [], []
+        readers = []
+        if capture:
+            # Drain both pipes concurrently so a chatty child never blocks on a full pipe
+            readers = [
+                threading.Thread(target=read_capped, args=(proc.stdout, out_chunks), daemon=True),
+                threading.Thread(target=read_capped, args=(proc.stderr, err_chunks), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            # Don't hang on pipes inherited by a backgrounded grandchild (e.g. an ssh master)
+            for reader in readers:
+                reader.join(timeout=1)
+
+        stdout = b"".join(out_chunks).decode("utf-8", errors="replace") if capture else None
+        stderr = b"".join(err_chunks).decode("utf-8", errors="replace") if capture else None
+        if returncode == 0:
+            add_log(f"Success: {stdout[:200] if stdout else 'OK'}")
+            return True, stdout
         else:
-            add_log(f"Failed: {result.stderr[:200] if result.stderr else 'Unknown error'}", "error")
-            return False, result.stderr
+            add_log(f"Failed: {stderr[:200] if stderr else 'Unknown error'}", "error")
+            return False, stderr
     except subprocess.TimeoutExpired:
-        add_log("Command timed out", "error")
-        return False, "Command timed out"
+        add_log(f"Command timed out after {timeout}s", "error")
+        return False, f"Command timed out after {timeout}s"
+    except Exception as e:
+        add_log(f"Error: {str(e)}", "error")
+        return False, str(e)
+
+def ssh_cmd(remote_cmd):
+    """Build the ssh argv that runs remote_cmd on the Pi."""
+    return [*SSH_BASE, remote_cmd]
+
+def ssh_host_config(host):
+    """~/.ssh/config settings for host (Paramiko doesn't read the file by itself)."""
+    path = os.path.expanduser("~/.ssh/config")
+    if not os.path.exists(path):
+        return {}
+    return paramiko.SSHConfig.from_path(path).lookup(host)
+
+def get_ssh_client():
+    """Return the shared Paramiko client, (re)connecting if the transport is gone."""
+    global ssh_client
+    transport = ssh_client.get_transport() if ssh_client else None
+    if transport is None or not transport.is_active():
+        # Honour host aliases, ports and IdentityFile like the ssh command does
+        host_config = ssh_host_config(CONFIG["pi_host"])
+        client = paramiko.SSHClient()
+        client.load_system_host_keys()
+        client.connect(
+            host_config.get("hostname", CONFIG["pi_host"]),
+            port=int(host_config.get("port", 22)),
+            username=CONFIG["pi_user"],
+            key_filename=host_config.get("identityfile"),
+            timeout=5
+        )
+        client.get_transport().set_keepalive(30)
+        ssh_client = client
+    return ssh_client
+
+def get_paramiko_client():
+    """The shared Paramiko client, or None if the OpenSSH client should be used instead.
+
+    A login/SSH failure (settings Paramiko doesn't support, say) switches to OpenSSH for
+    the rest of the session; network errors are raised - ssh wouldn't get through either.
+    """
+    global paramiko_failed
+    if paramiko is None or paramiko_failed:
+        return None
+    try:
+        with ssh_client_lock:
+            return get_ssh_client()
+    except paramiko.SSHException as e:
+        paramiko_failed = True
+        add_log(f"Paramiko login failed ({e}) - falling back to ssh", "error")
+        return None
+
+def read_channel_capped(stream, limit=OUTPUT_LIMIT):
+    """Read a Paramiko channel file, keeping only its first `limit` bytes."""
+    data = stream.read(limit)
+    while stream.read(4096):
+        pass
+    return data.decode("utf-8", errors="replace")
+
+def run_remote(remote_cmd, timeout=30):
+    """Run a shell command on the Pi and return (success, output).
+
+    Uses one long-lived Paramiko connection when available (no ssh process per
+    call), otherwise the multiplexed OpenSSH client via run_command.
+    """
+    global ssh_client
+    try:
+        client = get_paramiko_client()
     except Exception as e:
         add_log(f"Error: {str(e)}", "error")
         return False, str(e)
+    if client is None:
+        return run_command(ssh_cmd(remote_cmd), timeout=timeout)
 
+    add_log(f"Running on Pi: {remote_cmd}")
+    try:
+        _, stdout, stderr = client.exec_command(remote_cmd, timeout=timeout)
+        output = read_channel_capped(stdout)
+        error = read_channel_capped(stderr)
+        if stdout.channel.recv_exit_status() == 0:
+            add_log(f"Success: {output[:200] if output else 'OK'}")
+            return True, output
+        else:
+            add_log(f"Failed: {error[:200] if error else 'Unknown error'}", "error")
+            return False, error
+    except socket.timeout:
+        add_log(f"Command timed out after {timeout}s", "error")
+        return False, f"Command timed out after {timeout}s"
+    except Exception as e:
+        if isinstance(e, paramiko.SSHException):
+            with ssh_client_lock:
+                ssh_client = None  # Reconnect on the next call
+        add_log(f"Error: {str(e)}", "error")
+        return False, str(e)
+
+def warm_ssh_master():
+    """Open the shared SSH connection in the background (no-op if it is already up)."""
+    def connect():
+        try:
+            if get_paramiko_client() is not None:
+                return
+            # `-O check` is a local socket query; only pay the handshake if no master is running
+            check = subprocess.run(spawn_argv(["ssh", *SSH_OPTS, "-O", "check", SSH_TARGET]),
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   close_fds=SPAWN_CLOSE_FDS, timeout=5)
+            if check.returncode != 0:
+                subprocess.run(spawn_argv(["ssh", *SSH_OPTS, "-MNf", SSH_TARGET]),
+                               stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, close_fds=SPAWN_CLOSE_FDS, timeout=15)
+        except Exception as e:
+            add_log(f"SSH connect failed: {str(e)}", "error")
+    threading.Thread(target=connect, daemon=True).start()
+
+def ttl_cache(seconds):
+    """Cache a no-argument function's result for `seconds`.
+
+    Concurrent callers wait for the in-flight call and share its result.
+    Call `.invalidate()` on the wrapped function to force a fresh call.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        cache = {"expires": 0, "value": None}
+
+        @functools.wraps(func)
+        def wrapper():
+            with lock:
+                if time.monotonic() < cache["expires"]:
+                    return cache["value"]
+                cache["value"] = func()
+                cache["expires"] = time.monotonic() + seconds
+                return cache["value"]
+
+        def invalidate():
+            cache["expires"] = 0
+
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=1)
 def get_project_path():
-    """Get the path to the powerball_simulator directory."""
+    """Get the path to the powerball_simulator directory (resolved once)."""
     # Check if we're in the project directory
     if os.path.exists("game_engine.py"):
         return os.getcwd()
@@ -79,6 +383,43 @@ def get_project_path():
     # Default to current directory
     return os.getcwd()
 
+# Directories that never show up in `git status` - not worth walking
+STATUS_SKIP_DIRS = {".git", "venv", ".venv", "__pycache__", "node_modules"}
+
+# Last `git status --short` result and the tree state it was taken at
+git_status_cache = {"key": None, "value": None}
+
+def git_tree_key(project_path):
+    """Cheap fingerprint of everything `git status` looks at.
+
+    The index and HEAD reflog move on add/commit/checkout/pull; the newest mtime in the
+    work tree catches edits, new files and deletions (which touch their directory).
+    Returns None (never cached) if the walk trips over a file that vanished or can't be read.
+    """
+    def mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    git_dir = os.path.join(project_path, ".git")
+    newest = 0
+    stack = [project_path]
+    try:
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in STATUS_SKIP_DIRS:
+                            stack.append(entry.path)
+                            newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    else:
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+    except OSError:
+        # e.g. an editor swap file deleted mid-walk - just treat it as a cache miss
+        return None
+    return (mtime(os.path.join(git_dir, "index")), mtime(os.path.join(git_dir, "logs", "HEAD")),
+            mtime(os.path.join(git_dir, "HEAD")), newest)
+
 # HTML Template
 DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -87,150 +428,7 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Powerball Dev Panel</title>
-    <style>
-        * { box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #0f0f1a;
-            color: #e0e0e0;
-            margin: 0;
-            padding: 20px;
-            min-height: 100vh;
-        }
-        .container { max-width: 900px; margin: 0 auto; }
-        h1 { color: #ffd700; margin-bottom: 5px; }
-        .subtitle { color: #666; margin-bottom: 30px; }
-
-        .grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
-        @media (max-width: 768px) { .grid { grid-template-columns: 1fr; } }
-
-        .card {
-            background: #1a1a2e;
-            border-radius: 12px;
-            padding: 20px;
-            border: 1px solid #2a2a4a;
-        }
-        .card h2 {
-            margin: 0 0 15px 0;
-            color: #ffd700;
-            font-size: 1.1rem;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        .card-deploy {
-            background: linear-gradient(135deg, #1a1a2e 0%, #2a1a3e 100%);
-            border: 2px solid #ffd700;
-        }
-        .card-deploy h2 {
-            font-size: 1.4rem;
-        }
-
-        .btn {
-            padding: 12px 20px;
-            border: none;
-            border-radius: 8px;
-            font-size: 14px;
-            cursor: pointer;
-            transition: all 0.2s;
-            display: inline-flex;
-            align-items: center;
-            gap: 8px;
-            margin: 5px 5px 5px 0;
-        }
-        .btn:hover { transform: translateY(-1px); }
-        .btn:disabled { opacity: 0.5; cursor: not-allowed; transform: none; }
-
-        .btn-primary { background: #ffd700; color: #1a1a2e; }
-        .btn-success { background: #28a745; color: white; }
-        .btn-danger { background: #dc3545; color: white; }
-        .btn-secondary { background: #444; color: white; }
-        .btn-info { background: #17a2b8; color: white; }
-
-        .btn-deploy {
-            background: linear-gradient(135deg, #ffd700 0%, #ffaa00 100%);
-            color: #1a1a2e;
-            font-size: 18px;
-            font-weight: bold;
-            padding: 18px 30px;
-            box-shadow: 0 4px 15px rgba(255, 215, 0, 0.3);
-        }
-        .btn-deploy:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 20px rgba(255, 215, 0, 0.4);
-        }
-
-        .status-indicator {
-            display: inline-block;
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        .status-running { background: #28a745; }
-        .status-stopped { background: #dc3545; }
-        .status-unknown { background: #ffc107; }
-
-        .log-container {
-            background: #0a0a15;
-            border-radius: 8px;
-            padding: 15px;
-            height: 300px;
-            overflow-y: auto;
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 12px;
-        }
-        .log-entry { margin: 4px 0; }
-        .log-time { color: #666; }
-        .log-info { color: #17a2b8; }
-        .log-error { color: #dc3545; }
-        .log-success { color: #28a745; }
-
-        .config-display {
-            background: #0a0a15;
-            border-radius: 8px;
-            padding: 15px;
-            font-family: monospace;
-            font-size: 12px;
-        }
-        .config-item { margin: 5px 0; }
-        .config-key { color: #ffd700; }
-        .config-value { color: #17a2b8; }
-
-        .links { margin-top: 15px; }
-        .links a {
-            color: #ffd700;
-            text-decoration: none;
-            margin-right: 20px;
-        }
-        .links a:hover { text-decoration: underline; }
-
-        .full-width { grid-column: 1 / -1; }
-
-        input[type="text"] {
-            padding: 10px;
-            border: 1px solid #333;
-            border-radius: 6px;
-            background: #0a0a15;
-            color: white;
-            width: 100%;
-            margin-bottom: 10px;
-        }
-
-        .deploy-status {
-            margin-top: 10px;
-            padding: 8px 12px;
-            border-radius: 6px;
-            font-size: 13px;
-            display: none;
-        }
-        .deploy-status.active {
-            display: block;
-            background: rgba(255, 215, 0, 0.1);
-            border: 1px solid #ffd700;
-            color: #ffd700;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ url_for('static', filename='dev_panel.css', v=asset_version) }}">
 </head>
 <body>
     <div class="container">
@@ -307,180 +505,151 @@ DASHBOARD_HTML = """
 
     <script>
         const PI_HOST = '{{ pi_host }}';
-
-        async function api(endpoint, data = {}) {
-            try {
-                const resp = await fetch('/api/' + endpoint, {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify(data)
-                });
-                return await resp.json();
-            } catch (e) {
-                return {success: false, error: e.message};
-            }
-        }
-
-        async function gitStatus() {
-            await api('git_status');
-            refreshLogs();
-        }
-
-        async function gitPull() {
-            await api('git_pull');
-            refreshLogs();
-        }
-
-        async function gitCommitPush() {
-            const msg = document.getElementById('commitMsg').value || 'Update from dev panel';
-            await api('git_commit_push', {message: msg});
-            document.getElementById('commitMsg').value = '';
-            refreshLogs();
-        }
-
-        async function piPull() {
-            await api('pi_pull');
-            refreshLogs();
-        }
-
-        async function piRestart() {
-            await api('pi_restart');
-            refreshLogs();
-        }
-
-        async function piStatus() {
-            const result = await api('pi_status');
-            refreshLogs();
-            const el = document.getElementById('piStatus');
-            if (result.output && result.output.includes('powerball')) {
-                el.innerHTML = '<span class="status-indicator status-running"></span> App running';
-            } else {
-                el.innerHTML = '<span class="status-indicator status-stopped"></span> App not detected';
-            }
-        }
-
-        async function quickDeploy() {
-            const statusEl = document.getElementById('deployStatus');
-            statusEl.className = 'deploy-status active';
-            statusEl.textContent = 'Deploying...';
-
-            const msg = document.getElementById('commitMsg').value || 'Deploy from dev panel';
-            const result = await api('quick_deploy', {message: msg});
-            document.getElementById('commitMsg').value = '';
-            refreshLogs();
-
-            if (result.success) {
-                statusEl.textContent = 'Deploy complete!';
-                setTimeout(() => { statusEl.className = 'deploy-status'; }, 3000);
-            } else {
-                statusEl.textContent = 'Deploy failed - check logs';
-                statusEl.style.borderColor = '#dc3545';
-                statusEl.style.color = '#dc3545';
-            }
-        }
-
-        async function runSshCmd() {
-            const cmd = document.getElementById('sshCmd').value;
-            if (!cmd) return;
-            await api('ssh_command', {command: cmd});
-            refreshLogs();
-        }
-
-        async function refreshLogs() {
-            const result = await api('get_logs');
-            if (result.logs) {
-                const container = document.getElementById('logContainer');
-                container.innerHTML = result.logs.map(log =>
-                    `<div class="log-entry">
-                        <span class="log-time">[${log.time}]</span>
-                        <span class="log-${log.level}">${escapeHtml(log.message)}</span>
-                    </div>`
-                ).join('');
-                container.scrollTop = container.scrollHeight;
-            }
-        }
-
-        function clearLogs() {
-            api('clear_logs');
-            document.getElementById('logContainer').innerHTML = '';
-        }
-
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
-
-        // Initial load
-        refreshLogs();
-
-        // Refresh logs periodically
-        setInterval(refreshLogs, 5000);
     </script>
+    <script src="{{ url_for('static', filename='dev_panel.js', v=asset_version) }}"></script>
 </body>
 </html>
 """
 
-@app.route('/')
-def dashboard():
-    return render_template_string(
-        DASHBOARD_HTML,
+STATIC_ASSETS = ("dev_panel.css", "dev_panel.js")
+
+def read_static_assets():
+    """Read the dashboard CSS/JS once: {name: raw bytes}."""
+    assets = {}
+    for name in STATIC_ASSETS:
+        with open(os.path.join(app.static_folder, name), "rb") as f:
+            assets[name] = f.read()
+    return assets
+
+def get_asset_version(assets):
+    """Short content hash of the dashboard CSS/JS, used to bust browser caches."""
+    digest = hashlib.md5()
+    for name in STATIC_ASSETS:
+        digest.update(assets[name])
+    return digest.hexdigest()[:8]
+
+STATIC_ASSET_DATA = read_static_assets()
+ASSET_VERSION = get_asset_version(STATIC_ASSET_DATA)
+
+# Pre-compressed copies, built once so gzip costs nothing per request
+STATIC_ASSETS_GZ = {
+    name: gzip.compress(data, compresslevel=9) for name, data in STATIC_ASSET_DATA.items()
+}
+
+# Everything on the page comes from CONFIG, so render it once at import
+with app.test_request_context():
+    DASHBOARD_PAGE = app.jinja_env.from_string(DASHBOARD_HTML).render(
+        asset_version=ASSET_VERSION,
         pi_host=CONFIG["pi_host"],
         pi_user=CONFIG["pi_user"],
         pi_path=CONFIG["pi_project_path"]
     )
+DASHBOARD_PAGE_GZ = gzip.compress(DASHBOARD_PAGE.encode(), compresslevel=9)
+DASHBOARD_ETAG = hashlib.md5(DASHBOARD_PAGE.encode()).hexdigest()
+
+def accepts_gzip():
+    """Whether the current request accepts a gzip-encoded response."""
+    return "gzip" in request.accept_encodings
+
+@app.after_request
+def cache_static_assets(response):
+    # Static URLs carry the content hash, so browsers can keep them forever
+    if request.endpoint == "static":
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        response.vary.add("Accept-Encoding")
+        filename = (request.view_args or {}).get("filename")
+        if response.status_code == 200 and filename in STATIC_ASSETS_GZ and accepts_gzip():
+            response.direct_passthrough = False
+            response.set_data(STATIC_ASSETS_GZ[filename])
+            response.headers["Content-Encoding"] = "gzip"
+    return response
+
+@app.route('/')
+def dashboard():
+    # Revalidate on each load (a restart may ship new asset hashes) - usually a 304
+    if accepts_gzip():
+        response = Response(DASHBOARD_PAGE_GZ, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+        response.set_etag(DASHBOARD_ETAG + "-gz")
+    else:
+        response = Response(DASHBOARD_PAGE, mimetype="text/html")
+        response.set_etag(DASHBOARD_ETAG)
+    response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+def exclusive_git(func):
+    """Refuse a local git endpoint with 409 while a deploy (or other git endpoint) runs."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not git_lock.acquire(blocking=False):
+            add_log("Git is busy (deploy in progress) - try again when it finishes", "error")
+            return jsonify({"success": False, "error": "Git operation in progress"}), 409
+        try:
+            return func(*args, **kwargs)
+        finally:
+            git_lock.release()
+    return wrapper
 
 @app.route('/api/git_status', methods=['POST'])
+@exclusive_git
 def git_status():
     project_path = get_project_path()
-    success, output = run_command("git status --short", cwd=project_path)
+    key = git_tree_key(project_path)
+    if key is not None and key == git_status_cache["key"]:
+        # The page only shows results through the log, so report the cached output there too
+        output = git_status_cache["value"]
+        add_log("git status: tree unchanged since last check")
+        add_log(f"Success: {output[:200] if output else 'OK'}")
+        return jsonify({"success": True, "output": output})
+    success, output = run_command(["git", "-C", project_path, "status", "--short"], timeout=5)
+    # Only keep results for a tree that held still (git may also refresh the index itself)
+    if success and key is not None and git_tree_key(project_path) == key:
+        git_status_cache.update(key=key, value=output)
     return jsonify({"success": success, "output": output})
 
 @app.route('/api/git_pull', methods=['POST'])
+@exclusive_git
 def git_pull():
     project_path = get_project_path()
-    success, output = run_command("git pull", cwd=project_path)
+    success, output = run_command(["git", "-C", project_path, "pull"], timeout=30)
     return jsonify({"success": success, "output": output})
 
 @app.route('/api/git_commit_push', methods=['POST'])
+@exclusive_git
 def git_commit_push():
     data = request.json or {}
     message = data.get("message", "Update from dev panel")
     project_path = get_project_path()
     
-    # Add all changes
-    success, _ = run_command("git add -A", cwd=project_path)
-    if not success:
-        return jsonify({"success": False, "error": "git add failed"})
-    
-    # Commit
-    success, output = run_command(f'git commit -m "{message}"', cwd=project_path)
-    if not success and "nothing to commit" not in output:
-        return jsonify({"success": False, "error": "git commit failed"})
-    
-    # Push
-    success, output = run_command(f"git push {CONFIG['git_remote']} {CONFIG['git_branch']}", cwd=project_path)
+    # Add, commit & push in one subprocess (a clean tree just pushes)
+    success, output = run_command(
+        ["sh", "-c", GIT_DEPLOY_SCRIPT, "sh", project_path, message, CONFIG["git_remote"], CONFIG["git_branch"]],
+        timeout=120
+    )
     return jsonify({"success": success, "output": output})
 
 @app.route('/api/pi_pull', methods=['POST'])
 def pi_pull():
-    cmd = f'ssh {CONFIG["pi_user"]}@{CONFIG["pi_host"]} "cd {CONFIG["pi_project_path"]} && git pull"'
-    success, output = run_command(cmd)
+    success, output = run_remote(PI_PULL_SCRIPT, timeout=60)
     return jsonify({"success": success, "output": output})
 
 @app.route('/api/pi_restart', methods=['POST'])
 def pi_restart():
-    # Kill only powerball-related processes (by path), clean up screens, then start fresh
-    cmd = f'ssh {CONFIG["pi_user"]}@{CONFIG["pi_host"]} "pkill -f \'powerball_simulator/main.py\' 2>/dev/null; screen -ls | grep powerball | cut -d. -f1 | awk \'{{print $1}}\' | xargs -r -I {{}} screen -S {{}} -X quit 2>/dev/null; screen -wipe 2>/dev/null; cd {CONFIG["pi_project_path"]} && screen -dmS powerball bash -c \'source venv/bin/activate && python main.py\'"'
-    success, output = run_command(cmd)
+    success, output = run_remote(PI_RESTART_SCRIPT, timeout=30)
     if success:
+        check_pi_status.invalidate()
         add_log("Killed old powerball processes and started fresh session", "success")
     return jsonify({"success": success, "output": output})
 
+@ttl_cache(2)
+def check_pi_status():
+    """Probe the Pi for the powerball screen session (shared across rapid clicks)."""
+    return run_remote(PI_STATUS_SCRIPT, timeout=5)
+
 @app.route('/api/pi_status', methods=['POST'])
 def pi_status():
-    cmd = f'ssh {CONFIG["pi_user"]}@{CONFIG["pi_host"]} "screen -ls | grep powerball; ps aux | grep python | grep -v grep | head -3"'
-    success, output = run_command(cmd)
+    success, output = check_pi_status()
     return jsonify({"success": success, "output": output})
 
 @app.route('/api/ssh_command', methods=['POST'])
@@ -490,50 +659,160 @@ def ssh_command():
     if not command:
         return jsonify({"success": False, "error": "No command provided"})
     
-    cmd = f'ssh {CONFIG["pi_user"]}@{CONFIG["pi_host"]} "{command}"'
-    success, output = run_command(cmd)
+    success, output = run_remote(command, timeout=60)
     return jsonify({"success": success, "output": output})
 
+def run_deploy(message):
+    """Commit, push, pull on the Pi and restart. Returns {"success": ..., "error": ...}."""
+    with git_lock:
+        project_path = get_project_path()
+        
+        add_log("=== QUICK DEPLOY STARTED ===")
+        
+        # Bring up the Pi connection while the local git steps run
+        warm_ssh_master()
+        
+        # 1. Git add & commit (a clean tree just reports HEAD), in the same shell as the unpushed count
+        success, output = run_command(["sh", "-c", GIT_COMMIT_SCRIPT, "sh", project_path, message], timeout=30)
+        lines = output.strip().splitlines() if success and output else []
+        if len(lines) < 2:
+            add_log("Commit failed, aborting deploy", "error")
+            return {"success": False, "error": "Commit failed"}
+        sha, unpushed = lines[-2], lines[-1]
+        
+        # Nothing to ship? (clean tree and no unpushed commits) - skip the push, but still
+        # pull on the Pi: an earlier "Commit & Push" may have pushed what it is missing
+        if unpushed == "0":
+            add_log("No local changes - skipping commit/push")
+            success, _ = run_remote(f"{PI_PULL_SCRIPT} && ({PI_RESTART_SCRIPT})", timeout=90)
+            if not success:
+                add_log("Pull/restart on Pi failed", "error")
+                return {"success": False, "error": "Pull/restart on Pi failed"}
+            check_pi_status.invalidate()
+            add_log("=== DEPLOY COMPLETE ===", "success")
+            return {"success": True}
+        
+        # 2-3. Push while the Pi is already connected and waiting for the commit to land,
+        # then fast-forward and restart there in the same ssh session
+        # (a fresh stop file per deploy, so a late cancel can't hit a retry's wait)
+        stop_file = shlex.quote(f"/tmp/pb-deploy-stop-{os.urandom(6).hex()}")
+        remote = remote_executor.submit(
+            run_remote, f"SHA={shlex.quote(sha)}; STOP={stop_file}; {PI_AWAIT_DEPLOY_SCRIPT}", 180
+        )
+        success, _ = run_command(
+            ["git", "-C", project_path, "push", CONFIG["git_remote"], CONFIG["git_branch"]],
+            timeout=120
+        )
+        if not success:
+            # Tell the Pi to stop waiting, and let it finish so a retry gets the remote worker
+            run_remote(f"STOP={stop_file}; {PI_CANCEL_DEPLOY_SCRIPT}", timeout=10)
+            remote.result()
+            add_log("Push failed, aborting deploy", "error")
+            return {"success": False, "error": "Push failed"}
+        
+        success, _ = remote.result()
+        if not success:
+            add_log("Pull/restart on Pi failed", "error")
+            return {"success": False, "error": "Pull/restart on Pi failed"}
+        
+        check_pi_status.invalidate()
+        add_log("=== DEPLOY COMPLETE ===", "success")
+        return {"success": True}
+
 @app.route('/api/quick_deploy', methods=['POST'])
 def quick_deploy():
+    # Deploy in the background; the client follows progress via logs + deploy_status
+    global last_deploy_id
     data = request.json or {}
     message = data.get("message", "Deploy from dev panel")
-    project_path = get_project_path()
-    
-    add_log("=== QUICK DEPLOY STARTED ===")
-    
-    # 1. Git add & commit
-    run_command("git add -A", cwd=project_path)
-    run_command(f'git commit -m "{message}"', cwd=project_path)
-    
-    # 2. Push
-    success, _ = run_command(f"git push {CONFIG['git_remote']} {CONFIG['git_branch']}", cwd=project_path)
-    if not success:
-        add_log("Push failed, aborting deploy", "error")
-        return jsonify({"success": False, "error": "Push failed"})
-    
-    # 3. Pull on Pi
-    cmd = f'ssh {CONFIG["pi_user"]}@{CONFIG["pi_host"]} "cd {CONFIG["pi_project_path"]} && git pull"'
-    success, _ = run_command(cmd)
-    if not success:
-        add_log("Pull on Pi failed", "error")
-        return jsonify({"success": False, "error": "Pull on Pi failed"})
-    
-    # 4. Kill only powerball processes and restart on Pi
-    cmd = f'ssh {CONFIG["pi_user"]}@{CONFIG["pi_host"]} "pkill -f \'powerball_simulator/main.py\' 2>/dev/null; screen -ls | grep powerball | cut -d. -f1 | awk \'{{print $1}}\' | xargs -r -I {{}} screen -S {{}} -X quit 2>/dev/null; screen -wipe 2>/dev/null; cd {CONFIG["pi_project_path"]} && screen -dmS powerball bash -c \'source venv/bin/activate && python main.py\'"'
-    success, _ = run_command(cmd)
-    
-    add_log("=== DEPLOY COMPLETE ===", "success")
-    return jsonify({"success": True})
-
-@app.route('/api/get_logs', methods=['POST'])
+    with deploys_lock:
+        last_deploy_id += 1
+        deploy_id = last_deploy_id
+        deploys[deploy_id] = deploy_executor.submit(run_deploy, message)
+        # Forget old deploys so the dict doesn't grow for the panel's lifetime
+        deploys.pop(deploy_id - DEPLOYS_KEPT, None)
+    return jsonify({"success": True, "deploy_id": deploy_id})
+
+@app.route('/api/deploy_status/<int:deploy_id>', methods=['GET'])
+def deploy_status(deploy_id):
+    future = deploys.get(deploy_id)
+    if future is None:
+        return jsonify({"success": False, "error": "Unknown deploy"}), 404
+    if not future.done():
+        return jsonify({"done": False})
+    return jsonify({"done": True, **future.result()})
+
+@app.route('/api/get_logs', methods=['GET'])
 def get_logs():
-    return jsonify({"logs": logs})
+    # Unchanged since the client's last poll - skip serializing the logs
+    etag = f'W/"{logs_version}"'
+    if request.headers.get("If-None-Match") == etag:
+        return "", 304
+
+    # Only send entries the client hasn't seen (full list on first load or after a restart)
+    version, full, entries = logs_since(request.args.get("since", 0, type=int))
+    response = jsonify({"logs": entries, "full": full, "version": version})
+    response.headers["ETag"] = etag
+    return response
+
+@app.route('/api/logs_html', methods=['GET'])
+def logs_html():
+    # Same ETag/since contract as get_logs, but returns the pre-rendered markup
+    etag = f'W/"{logs_version}"'
+    if request.headers.get("If-None-Match") == etag:
+        return "", 304
+
+    version, full, entries = logs_since(request.args.get("since", 0, type=int))
+    response = Response("".join(entry["html"] for entry in entries), mimetype="text/html")
+    response.headers["ETag"] = etag
+    response.headers["X-Logs-Version"] = str(version)
+    response.headers["X-Logs-Full"] = "1" if full else "0"
+    return response
+
+@app.route('/api/logs/stream')
+def logs_stream():
+    global open_log_streams
+    with open_log_streams_lock:
+        if open_log_streams >= MAX_LOG_STREAMS:
+            return "Too many log streams - poll /api/logs_html instead", 503
+        open_log_streams += 1
+
+    def release():
+        global open_log_streams
+        with open_log_streams_lock:
+            open_log_streams -= 1
+
+    # Resume from the browser's last seen entry when EventSource reconnects
+    last_id = request.headers.get("Last-Event-ID", 0, type=int)
+
+    def generate():
+        nonlocal last_id
+        while True:
+            with logs_changed:
+                logs_changed.wait_for(lambda: logs_version != last_id, timeout=15)
+            version, full, entries = logs_since(last_id)
+
+            if version == last_id:
+                # Keep-alive comment so dead connections get noticed
+                yield ": ping\n\n"
+            elif full:
+                # First connect, or the panel restarted since the browser's last entry
+                fragment = "".join(entry["html"] for entry in entries)
+                yield f"event: reset\nid: {version}\ndata: {fragment}\n\n"
+            else:
+                for entry in entries:
+                    yield f"id: {entry['id']}\ndata: {entry['html']}\n\n"
+            last_id = version
+
+    response = Response(generate(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+    # Runs when the server closes the response, i.e. once the client has gone
+    response.call_on_close(release)
+    return response
 
 @app.route('/api/clear_logs', methods=['POST'])
 def clear_logs():
-    global logs
-    logs = []
+    with logs_changed:
+        logs.clear()
     add_log("Logs cleared")
     return jsonify({"success": True})
 
@@ -551,4 +830,16 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to exit")
     print("=" * 50)
 
-    app.run(host='127.0.0.1', port=CONFIG['dev_panel_port'], debug=False)
+    logging.basicConfig(
+        level=CONFIG["console_log_level"],
+        format="[%(asctime)s] [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S"
+    )
+    warm_ssh_master()
+    # Prefer waitress (multi-threaded production server); fall back to Werkzeug's threaded dev server
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='127.0.0.1', port=CONFIG['dev_panel_port'], debug=False, threaded=True)
+    else:
+        serve(app, host='127.0.0.1', port=CONFIG['dev_panel_port'], threads=SERVER_THREADS)
@@ -7,12 +7,28 @@ import pygame
 import qrcode
 import io
 import os
-from game_engine import game
+from game_engine import game, WHITE_BALL_MAX, POWERBALL_MAX
 
 # Display settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 480
 FPS = 30
+IDLE_FPS = 5  # When nothing on screen is animating
+
+# Parts of the game screen that change between frames (the rest is static chrome)
+HEADER_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 50)
+NUMBERS_RECT = pygame.Rect(0, 50, SCREEN_WIDTH - 110, 65)
+
+# Window events after which the window contents must be presented again (minimize/restore,
+# expose) - whichever of them this pygame/SDL version has
+REDRAW_EVENTS = frozenset(
+    getattr(pygame, name)
+    for name in ("VIDEOEXPOSE", "WINDOWEVENT", "WINDOWSHOWN", "WINDOWEXPOSED", "WINDOWRESTORED")
+    if hasattr(pygame, name)
+)
+
+# Rendered text surfaces kept around (ball numbers + labels + recent counters)
+TEXT_CACHE_SIZE = 512
 
 # Colors
 BLACK = (0, 0, 0)
@@ -37,6 +53,9 @@ class Display:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         pygame.display.set_caption("Powerball Simulator")
+        # update() only reacts to these - don't queue touch/mouse motion for it to wade through
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, *REDRAW_EVENTS])
         self.clock = pygame.time.Clock()
         self.server_url = server_url
         
@@ -45,10 +64,33 @@ class Display:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
         self.font_tiny = pygame.font.Font(None, 18)
+
+        # Rendered text, keyed by (font, text, color) - see _text()
+        self._text_cache = {}
+        # Player card fonts/offsets per scale - see _card_style()
+        self._card_styles = {}
+        # Finished ball sprites, keyed by (number, is_powerball, matched) - see _ball_surface()
+        self._ball_surfaces = {}
+        # Balls never change, so rasterize them all up front
+        for n in range(1, WHITE_BALL_MAX + 1):
+            self._ball_surface(n, False, False)
+        for n in range(1, POWERBALL_MAX + 1):
+            self._ball_surface(n, True, False)
+        # ...and build the card fonts for every layout up front too
+        for num_players in range(1, 5):
+            self._card_style(self._get_card_dimensions(num_players)[2])
         
         # Generate QR code
         self.qr_large = self._generate_qr(server_url, 200)
         self.qr_small = self._generate_qr(server_url, 100)  # Larger for easier scanning on 7" screen
+
+        # Screens/overlays that never change, painted once
+        self._idle_bg = self._build_idle_screen()
+        self._qr_overlay_bg = self._build_qr_overlay()
+        self._game_bg = self._build_game_screen()
+        self._million_flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._million_flash.fill(GOLD)
+        self._million_flash.set_alpha(128)  # 50% opacity
         
         # Animation state
         self.ball_animation_frame = 0
@@ -65,6 +107,12 @@ class Display:
 
         # Million dollar win flash effect
         self.million_flash_timer = 0
+
+        # Dirty-rect presentation: rects drawn last frame, None if the last frame wasn't
+        # a plain game screen (so the next one has to go out in full)
+        self._last_dirty = None
+        # The idle screen never changes, so once it is up there is nothing to present
+        self._idle_shown = False
         
     def _generate_qr(self, url: str, size: int) -> pygame.Surface:
         """Generate a QR code as a Pygame surface."""
@@ -79,7 +127,21 @@ class Display:
         img_bytes.seek(0)
         
         surface = pygame.image.load(img_bytes)
-        return pygame.transform.scale(surface, (size, size))
+        # Match the display's pixel format so every blit takes the fast path
+        return pygame.transform.scale(surface, (size, size)).convert()
+
+    def _text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text, reusing the surface if this exact string was drawn recently."""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            if len(cache) >= TEXT_CACHE_SIZE:
+                # Evict the least recently used entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+        cache[key] = surface
+        return surface
 
     def _get_card_dimensions(self, num_players: int) -> tuple:
         """Get card width, height, and font scale based on player count."""
@@ -92,65 +154,92 @@ class Display:
         else:
             return 175, 165, 1.0  # Default small cards (4+)
 
-    def draw_idle_screen(self):
-        """Draw the idle screen with large QR code."""
-        self.screen.fill(DARK_GRAY)
+    def _build_idle_screen(self) -> pygame.Surface:
+        """Paint the idle screen (all static) onto its own surface."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(DARK_GRAY)
         
         # Title
-        title = self.font_large.render("POWERBALL SIMULATOR", True, GOLD)
+        title = self._text(self.font_large, "POWERBALL SIMULATOR", GOLD)
         title_rect = title.get_rect(centerx=SCREEN_WIDTH//2, y=30)
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Subtitle
-        subtitle = self.font_medium.render("How long until you win?", True, WHITE)
+        subtitle = self._text(self.font_medium, "How long until you win?", WHITE)
         subtitle_rect = subtitle.get_rect(centerx=SCREEN_WIDTH//2, y=80)
-        self.screen.blit(subtitle, subtitle_rect)
+        surface.blit(subtitle, subtitle_rect)
         
         # QR Code (centered)
         qr_rect = self.qr_large.get_rect(centerx=SCREEN_WIDTH//2, centery=SCREEN_HEIGHT//2 + 20)
-        self.screen.blit(self.qr_large, qr_rect)
+        surface.blit(self.qr_large, qr_rect)
         
         # Instructions
-        scan_text = self.font_medium.render("Scan to Play!", True, WHITE)
+        scan_text = self._text(self.font_medium, "Scan to Play!", WHITE)
         scan_rect = scan_text.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 80)
-        self.screen.blit(scan_text, scan_rect)
+        surface.blit(scan_text, scan_rect)
         
         # URL as fallback
-        url_text = self.font_small.render(self.server_url, True, LIGHT_GRAY)
+        url_text = self._text(self.font_small, self.server_url, LIGHT_GRAY)
         url_rect = url_text.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 40)
-        self.screen.blit(url_text, url_rect)
+        surface.blit(url_text, url_rect)
+        return surface.convert()
+
+    def draw_idle_screen(self):
+        """Draw the idle screen with large QR code."""
+        self.screen.blit(self._idle_bg, (0, 0))
     
-    def draw_ball(self, x: int, y: int, number: int, is_powerball: bool = False, matched: bool = False):
-        """Draw a lottery ball."""
+    def _blit_batch(self, blits: list):
+        """Blit a list of (surface, dest) pairs in one call."""
+        if hasattr(self.screen, "fblits"):
+            self.screen.fblits(blits)  # pygame-ce
+        else:
+            self.screen.blits(blits, doreturn=False)
+
+    def _ball_surface(self, number: int, is_powerball: bool, matched: bool) -> pygame.Surface:
+        """Return the finished sprite for a ball (circle, outline and number), drawn once."""
+        key = (number, is_powerball, matched)
+        surface = self._ball_surfaces.get(key)
+        if surface is None:
+            radius = 22 if is_powerball else 20
+            
+            if matched:
+                color = GREEN
+            elif is_powerball:
+                color = POWERBALL_RED
+            else:
+                color = WHITE
+            
+            # Ball circle
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            pygame.draw.circle(surface, BLACK, (radius, radius), radius, 2)
+            
+            # Number
+            num_text = self._text(self.font_small, str(number), BLACK if not (is_powerball and not matched) else WHITE)
+            surface.blit(num_text, num_text.get_rect(center=(radius, radius)))
+            surface = self._ball_surfaces[key] = surface.convert_alpha()
+        return surface
+
+    def draw_ball(self, x: int, y: int, number: int, is_powerball: bool = False, matched: bool = False,
+                  blits: list = None):
+        """Draw a lottery ball centered on (x, y) - or queue it on `blits` for _blit_batch()."""
         radius = 22 if is_powerball else 20
-        
-        if matched:
-            color = GREEN
-        elif is_powerball:
-            color = POWERBALL_RED
+        entry = (self._ball_surface(number, is_powerball, matched), (x - radius, y - radius))
+        if blits is None:
+            self.screen.blit(*entry)
         else:
-            color = WHITE
-        
-        # Ball circle
-        pygame.draw.circle(self.screen, color, (x, y), radius)
-        pygame.draw.circle(self.screen, BLACK, (x, y), radius, 2)
-        
-        # Number
-        num_text = self.font_small.render(str(number), True, BLACK if not (is_powerball and not matched) else WHITE)
-        num_rect = num_text.get_rect(center=(x, y))
-        self.screen.blit(num_text, num_rect)
+            blits.append(entry)
     
     def draw_winning_numbers(self, whites: list, powerball: int, y_pos: int):
         """Draw the current winning numbers."""
         start_x = SCREEN_WIDTH // 2 - 70  # Shifted right for better spacing from label
 
         # Label - fixed left margin for even spacing
-        label = self.font_small.render("WINNING NUMBERS:", True, GOLD)
-        self.screen.blit(label, (10, y_pos - 8))
+        blits = [(self._text(self.font_small, "WINNING NUMBERS:", GOLD), (10, y_pos - 8))]
         
         # White balls
         for i, num in enumerate(whites):
-            self.draw_ball(start_x + i * 50, y_pos, num)
+            self.draw_ball(start_x + i * 50, y_pos, num, blits=blits)
         
         # Separator
         pygame.draw.line(self.screen, LIGHT_GRAY, 
@@ -158,41 +247,70 @@ class Display:
                         (start_x + 235, y_pos + 15), 2)
         
         # Powerball
-        self.draw_ball(start_x + 280, y_pos, powerball, is_powerball=True)
+        self.draw_ball(start_x + 280, y_pos, powerball, is_powerball=True, blits=blits)
+        self._blit_batch(blits)
     
+    def _card_style(self, scale: float) -> dict:
+        """Fonts and pixel offsets for a player card at `scale` (built once per scale)."""
+        style = self._card_styles.get(scale)
+        if style is None:
+            stats_font = pygame.font.Font(None, int(18 * scale))
+            style = self._card_styles[scale] = {
+                "name_font": pygame.font.Font(None, int(24 * scale)),
+                "nums_font": stats_font,  # Same size as the stats - share one Font
+                "stats_font": stats_font,
+                "padding": int(8 * scale),
+                "line_height": int(18 * scale),
+                "indicator_radius": int(5 * scale),
+                "indicator_spacing": int(16 * scale),
+                "name_gap": int(4 * scale),
+                "stat_step": int(18 * scale) - int(2 * scale),
+                "indicator_x": int(8 * scale),
+                "indicator_y": int(6 * scale),
+                "pb_indicator_gap": int(10 * scale),
+                "mil_x": int(60 * scale),
+                "max_name_len": 12 if scale < 1.3 else 16,
+            }
+        return style
+
     def draw_player_card(self, player: dict, x: int, y: int, width: int, height: int, scale: float = 1.0):
         """Draw a single player's stats card with optional scaling."""
         # Card background
         pygame.draw.rect(self.screen, (50, 50, 50), (x, y, width, height))
         pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, width, height), 1)
 
-        # Scale-adjusted fonts
-        name_font = pygame.font.Font(None, int(24 * scale))
-        nums_font = pygame.font.Font(None, int(18 * scale))
-        stats_font = pygame.font.Font(None, int(18 * scale))
-
-        padding = int(8 * scale)
-        line_height = int(18 * scale)
-        indicator_radius = int(5 * scale)
-        indicator_spacing = int(16 * scale)
+        # Scale-adjusted fonts and spacing
+        style = self._card_style(scale)
+        name_font = style["name_font"]
+        nums_font = style["nums_font"]
+        stats_font = style["stats_font"]
+
+        padding = style["padding"]
+        line_height = style["line_height"]
+        indicator_radius = style["indicator_radius"]
+        indicator_spacing = style["indicator_spacing"]
+        stat_step = style["stat_step"]
         curr_y = y + padding
+        # Text is queued and blitted in one batch at the end (nothing below overlaps it)
+        blits = []
 
         # Player name (truncate based on card size)
-        max_name_len = 12 if scale < 1.3 else 16
-        name_text = name_font.render(player["name"][:max_name_len], True, GOLD)
-        self.screen.blit(name_text, (x + padding, curr_y))
-        curr_y += line_height + int(4 * scale)
+        name_text = self._text(name_font, player["name"][:style["max_name_len"]], GOLD)
+        blits.append((name_text, (x + padding, curr_y)))
+        curr_y += line_height + style["name_gap"]
 
         # Player's numbers
         nums_str = " ".join(str(n).zfill(2) for n in player["numbers"])
         nums_str += f" | {str(player['powerball']).zfill(2)}"
-        nums_text = nums_font.render(nums_str, True, LIGHT_GRAY)
-        self.screen.blit(nums_text, (x + padding, curr_y))
+        nums_text = self._text(nums_font, nums_str, LIGHT_GRAY)
+        blits.append((nums_text, (x + padding, curr_y)))
         curr_y += line_height
 
         # Match indicators (current match = green, best match = cyan, miss = red)
         white_matches, pb_match = player["last_matches"]
         best_white = player.get("best_white_matches", 0)
+        indicator_x = x + padding + style["indicator_x"]
+        indicator_y = curr_y + style["indicator_y"]
         for i in range(5):
             if i < white_matches:
                 color = GREEN  # Current match
@@ -201,12 +319,12 @@ class Display:
             else:
                 color = RED    # Never matched
             pygame.draw.circle(self.screen, color,
-                             (x + padding + int(8 * scale) + i * indicator_spacing, curr_y + int(6 * scale)),
+                             (indicator_x + i * indicator_spacing, indicator_y),
                              indicator_radius)
         # PB match indicator
         pb_color = GREEN if pb_match else RED
         pygame.draw.circle(self.screen, pb_color,
-                          (x + padding + int(8 * scale) + 5 * indicator_spacing + int(10 * scale), curr_y + int(6 * scale)),
+                          (indicator_x + 5 * indicator_spacing + style["pb_indicator_gap"], indicator_y),
                           indicator_radius)
         curr_y += line_height
 
@@ -218,90 +336,101 @@ class Display:
         ]
 
         for stat in stats:
-            stat_text = stats_font.render(stat, True, WHITE)
-            self.screen.blit(stat_text, (x + padding, curr_y))
-            curr_y += line_height - int(2 * scale)
+            stat_text = self._text(stats_font, stat, WHITE)
+            blits.append((stat_text, (x + padding, curr_y)))
+            curr_y += stat_step
 
         # Net (colored)
         net = player["net"]
         net_color = GREEN if net >= 0 else RED
-        net_text = stats_font.render(f"Net: ${net:,}", True, net_color)
-        self.screen.blit(net_text, (x + padding, curr_y))
-        curr_y += line_height - int(2 * scale)
+        net_text = self._text(stats_font, f"Net: ${net:,}", net_color)
+        blits.append((net_text, (x + padding, curr_y)))
+        curr_y += stat_step
 
         # Time and near-wins
-        time_text = stats_font.render(f"Time: {player['elapsed_time']}", True, LIGHT_GRAY)
-        self.screen.blit(time_text, (x + padding, curr_y))
-        curr_y += line_height - int(2 * scale)
+        time_text = self._text(stats_font, f"Time: {player['elapsed_time']}", LIGHT_GRAY)
+        blits.append((time_text, (x + padding, curr_y)))
+        curr_y += stat_step
 
         # Best matches (in cyan)
-        best_text = stats_font.render(f"Best: {player.get('best_white_matches', 0)}/5", True, CYAN)
-        self.screen.blit(best_text, (x + padding, curr_y))
+        best_text = self._text(stats_font, f"Best: {player.get('best_white_matches', 0)}/5", CYAN)
+        blits.append((best_text, (x + padding, curr_y)))
 
         if player["million_plus_wins"] > 0:
-            mil_text = stats_font.render(f"$1M+: {player['million_plus_wins']}", True, GOLD)
-            self.screen.blit(mil_text, (x + padding + int(60 * scale), curr_y))
+            mil_text = self._text(stats_font, f"$1M+: {player['million_plus_wins']}", GOLD)
+            blits.append((mil_text, (x + padding + style["mil_x"], curr_y)))
 
         # Last prize flash
         if player["last_prize"] > 0:
-            prize_text = name_font.render(f"+${player['last_prize']:,}", True, GREEN)
+            prize_text = self._text(name_font, f"+${player['last_prize']:,}", GREEN)
             prize_rect = prize_text.get_rect(right=x + width - padding, top=y + padding)
-            self.screen.blit(prize_text, prize_rect)
+            blits.append((prize_text, prize_rect))
+
+        self._blit_batch(blits)
     
-    def draw_game_screen(self, state: dict):
-        """Draw the active game screen."""
-        self.screen.fill(DARK_GRAY)
+    def _build_game_screen(self) -> pygame.Surface:
+        """Paint the game screen's static chrome (header, title, small QR, divider)."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(DARK_GRAY)
         
         # Header bar
-        pygame.draw.rect(self.screen, BLACK, (0, 0, SCREEN_WIDTH, 50))
+        pygame.draw.rect(surface, BLACK, HEADER_RECT)
         
         # Title
-        title = self.font_medium.render("POWERBALL SIMULATOR", True, GOLD)
-        self.screen.blit(title, (10, 12))
+        title = self._text(self.font_medium, "POWERBALL SIMULATOR", GOLD)
+        surface.blit(title, (10, 12))
+        
+        # Small QR code (100x100, positioned in top-right)
+        surface.blit(self.qr_small, (SCREEN_WIDTH - 105, 45))
+        
+        # Divider (account for larger QR code)
+        pygame.draw.line(surface, LIGHT_GRAY, (10, 115), (SCREEN_WIDTH - 115, 115), 1)
+        return surface.convert()
+
+    def draw_game_screen(self, state: dict) -> list:
+        """Draw the active game screen. Returns the rects that can differ from the last frame."""
+        self.screen.blit(self._game_bg, (0, 0))
+        dirty = [HEADER_RECT, NUMBERS_RECT]
         
         # Drawing counter
-        drawing_text = self.font_small.render(f"Drawing #{state['total_drawings']:,}", True, WHITE)
+        drawing_text = self._text(self.font_small, f"Drawing #{state['total_drawings']:,}", WHITE)
         drawing_rect = drawing_text.get_rect(centerx=SCREEN_WIDTH//2, y=15)
         self.screen.blit(drawing_text, drawing_rect)
         
         # Last jackpot banner (if exists)
         if state.get('last_jackpot_rolls', 0) > 0:
-            jackpot_text = self.font_tiny.render(
-                f"LAST JACKPOT: {state['last_jackpot_rolls']:,} rolls by {state['last_jackpot_winner']}", 
-                True, GOLD
+            jackpot_text = self._text(
+                self.font_tiny,
+                f"LAST JACKPOT: {state['last_jackpot_rolls']:,} rolls by {state['last_jackpot_winner']}",
+                GOLD
             )
             jackpot_rect = jackpot_text.get_rect(centerx=SCREEN_WIDTH//2, y=38)
             self.screen.blit(jackpot_text, jackpot_rect)
         
         # Speed indicator
-        speed_text = self.font_tiny.render(f"{state['speed']}x", True, LIGHT_GRAY)
+        speed_text = self._text(self.font_tiny, f"{state['speed']}x", LIGHT_GRAY)
         self.screen.blit(speed_text, (SCREEN_WIDTH - 100, 18))
         
         # Paused indicator
         if not state.get("running") and state.get("player_count", 0) > 0:
-            paused_text = self.font_small.render("⏸ PAUSED", True, GOLD)
+            paused_text = self._text(self.font_small, "⏸ PAUSED", GOLD)
             self.screen.blit(paused_text, (SCREEN_WIDTH - 100, 32))
         
-        # Small QR code (100x100, positioned in top-right)
-        self.screen.blit(self.qr_small, (SCREEN_WIDTH - 105, 45))
-        
         # Winning numbers section
         if state["current_whites"]:
             self.draw_winning_numbers(state["current_whites"], state["current_powerball"], 80)
         
-        # Divider (account for larger QR code)
-        pygame.draw.line(self.screen, LIGHT_GRAY, (10, 115), (SCREEN_WIDTH - 115, 115), 1)
-        
         # Player grid
         players = state["players"]
         num_players = len(players)
 
         if num_players == 0:
             # No players message
-            msg = self.font_medium.render("Waiting for players...", True, WHITE)
+            msg = self._text(self.font_medium, "Waiting for players...", WHITE)
             msg_rect = msg.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(msg, msg_rect)
-            return
+            dirty.append(msg_rect)
+            return dirty
 
         # Get dynamic card dimensions based on player count
         grid_top = 125
@@ -323,8 +452,8 @@ class Display:
             cols = min(len(visible_players), 4)
 
             # Page indicator
-            page_text = self.font_tiny.render(f"Page {self.scroll_page + 1}/2", True, LIGHT_GRAY)
-            self.screen.blit(page_text, (10, SCREEN_HEIGHT - 20))
+            page_text = self._text(self.font_tiny, f"Page {self.scroll_page + 1}/2", LIGHT_GRAY)
+            dirty.append(self.screen.blit(page_text, (10, SCREEN_HEIGHT - 20)))
 
         # Calculate card layout (account for larger QR code on right side)
         available_width = SCREEN_WIDTH - 110  # Space for QR code
@@ -340,6 +469,8 @@ class Display:
             x = start_x + col * (card_width + 10)
             y = start_y
             self.draw_player_card(player, x, y, card_width, card_height, scale)
+            dirty.append(pygame.Rect(x, y, card_width, card_height))
+        return dirty
     
     def draw_jackpot_celebration(self, state: dict):
         """Draw the jackpot celebration screen with winner stats."""
@@ -354,15 +485,15 @@ class Display:
         winner_name = state.get("jackpot_winner", "Someone")
 
         # Giant text
-        winner_text = self.font_large.render("JACKPOT!!!", True, WHITE)
+        winner_text = self._text(self.font_large, "JACKPOT!!!", WHITE)
         winner_rect = winner_text.get_rect(centerx=SCREEN_WIDTH//2, y=60)
         self.screen.blit(winner_text, winner_rect)
 
-        name_text = self.font_large.render(f"{winner_name} WINS!", True, BLACK)
+        name_text = self._text(self.font_large, f"{winner_name} WINS!", BLACK)
         name_rect = name_text.get_rect(centerx=SCREEN_WIDTH//2, y=130)
         self.screen.blit(name_text, name_rect)
 
-        amount_text = self.font_large.render("$1,800,000,000", True, WHITE)
+        amount_text = self._text(self.font_large, "$1,800,000,000", WHITE)
         amount_rect = amount_text.get_rect(centerx=SCREEN_WIDTH//2, y=200)
         self.screen.blit(amount_text, amount_rect)
 
@@ -373,44 +504,47 @@ class Display:
 
         # Stats display - centered below the jackpot amount
         stats_y = 290
-        rolls_text = self.font_medium.render(f"Rolls: {rolls:,}", True, BLACK)
+        rolls_text = self._text(self.font_medium, f"Rolls: {rolls:,}", BLACK)
         rolls_rect = rolls_text.get_rect(centerx=SCREEN_WIDTH//2, y=stats_y)
         self.screen.blit(rolls_text, rolls_rect)
 
-        time_text = self.font_medium.render(f"Time: {time_played}", True, BLACK)
+        time_text = self._text(self.font_medium, f"Time: {time_played}", BLACK)
         time_rect = time_text.get_rect(centerx=SCREEN_WIDTH//2, y=stats_y + 40)
         self.screen.blit(time_text, time_rect)
 
-        spent_text = self.font_medium.render(f"Spent: ${spent:,}", True, BLACK)
+        spent_text = self._text(self.font_medium, f"Spent: ${spent:,}", BLACK)
         spent_rect = spent_text.get_rect(centerx=SCREEN_WIDTH//2, y=stats_y + 80)
         self.screen.blit(spent_text, spent_rect)
     
-    def draw_qr_overlay(self, state: dict):
-        """Draw a semi-transparent QR overlay with drawing counter still visible."""
+    def _build_qr_overlay(self) -> pygame.Surface:
+        """Paint the static part of the QR overlay onto a per-pixel-alpha surface."""
         # Semi-transparent dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(DARK_GRAY)
-        overlay.set_alpha(230)
-        self.screen.blit(overlay, (0, 0))
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        surface.fill((*DARK_GRAY, 230))
         
         # Title
-        title = self.font_large.render("JOIN THE GAME!", True, GOLD)
+        title = self._text(self.font_large, "JOIN THE GAME!", GOLD)
         title_rect = title.get_rect(centerx=SCREEN_WIDTH//2, y=40)
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Large QR code
         qr_rect = self.qr_large.get_rect(centerx=SCREEN_WIDTH//2, centery=SCREEN_HEIGHT//2)
-        self.screen.blit(self.qr_large, qr_rect)
+        surface.blit(self.qr_large, qr_rect)
+        
+        # URL
+        url_text = self._text(self.font_small, self.server_url, LIGHT_GRAY)
+        url_rect = url_text.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 30)
+        surface.blit(url_text, url_rect)
+        return surface.convert_alpha()
+
+    def draw_qr_overlay(self, state: dict):
+        """Draw a semi-transparent QR overlay with drawing counter still visible."""
+        self.screen.blit(self._qr_overlay_bg, (0, 0))
         
         # Drawing counter at bottom
-        drawing_text = self.font_medium.render(f"Drawing #{state['total_drawings']:,}", True, WHITE)
+        drawing_text = self._text(self.font_medium, f"Drawing #{state['total_drawings']:,}", WHITE)
         drawing_rect = drawing_text.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 60)
         self.screen.blit(drawing_text, drawing_rect)
-        
-        # URL
-        url_text = self.font_small.render(self.server_url, True, LIGHT_GRAY)
-        url_rect = url_text.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 30)
-        self.screen.blit(url_text, url_rect)
     
     def update(self, state: dict):
         """Main update function - call each frame."""
@@ -420,6 +554,10 @@ class Display:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
+            if event.type in REDRAW_EVENTS:
+                # The window lost its contents - present a full frame again
+                self._idle_shown = False
+                self._last_dirty = None
 
         # Update QR overlay timer
         if state.get("running") and state.get("player_count", 0) > 0:
@@ -435,29 +573,42 @@ class Display:
             self.million_flash_timer = 90  # 3 seconds at 30fps
             game.clear_million_flash()  # Acknowledge the win
 
-        # Decide which screen to show
+        # Decide which screen to show (dirty stays None for full-screen frames)
+        dirty = None
+        idle = not state.get("jackpot_hit") and state.get("player_count", 0) == 0
         if state.get("jackpot_hit"):
             self.draw_jackpot_celebration(state)
         elif state.get("player_count", 0) > 0:
             # Show game screen if there are players (running or paused)
-            self.draw_game_screen(state)
+            dirty = self.draw_game_screen(state)
 
             # Million dollar win flash effect (subtle gold overlay)
             if self.million_flash_timer > 0:
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.fill(GOLD)
-                overlay.set_alpha(128)  # 50% opacity
-                self.screen.blit(overlay, (0, 0))
+                self.screen.blit(self._million_flash, (0, 0))
                 self.million_flash_timer -= 1
+                dirty = None
 
             # Show QR overlay periodically (only when running)
             if state.get("running") and self.qr_overlay_active:
                 self.draw_qr_overlay(state)
-        else:
+                dirty = None
+        elif not self._idle_shown:
             self.draw_idle_screen()
 
-        pygame.display.flip()
-        self.clock.tick(FPS)
+        if idle and self._idle_shown:
+            pass  # Idle screen is already up
+        elif dirty is not None and self._last_dirty is not None:
+            # Also push last frame's rects so cards that moved or vanished get cleared
+            pygame.display.update(dirty + self._last_dirty)
+        else:
+            pygame.display.flip()
+        self._last_dirty = dirty
+        self._idle_shown = idle
+
+        # Full rate only while something moves (drawings, flashes, page flips)
+        animating = (state.get("running") or state.get("jackpot_hit") or self.million_flash_timer > 0
+                     or self.qr_overlay_active or state.get("player_count", 0) > 4)
+        self.clock.tick(FPS if animating else IDLE_FPS)
         return True
     
     def quit(self):
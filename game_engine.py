@@ -8,9 +8,15 @@ import threading
 import time
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib encoder
 
 STATE_FILE = "state.json"
 
@@ -18,6 +24,7 @@ STATE_FILE = "state.json"
 WHITE_BALL_MAX = 69
 POWERBALL_MAX = 26
 TICKET_COST = 2
+WHITE_BALLS = range(1, WHITE_BALL_MAX + 1)
 
 # Prize structure (white ball matches, powerball match) -> prize amount
 PRIZES = {
@@ -32,7 +39,60 @@ PRIZES = {
     (0, True): 4,
 }
 
-@dataclass
+JACKPOT_PRIZE = PRIZES[(5, True)]
+MILLION_PRIZE = 1_000_000  # Prizes from here up to the jackpot count as million+ wins
+
+# Same prizes as a table: PRIZE_TABLE[white_matches][pb_match] (a bool indexes as 0/1)
+# -> (amount, is_million_win, is_jackpot_win), the flags as 0/1 so they can be added
+PRIZE_TABLE = [[(0, 0, 0), (0, 0, 0)] for _ in range(6)]
+for (_whites, _pb), _amount in PRIZES.items():
+    PRIZE_TABLE[_whites][_pb] = (
+        _amount,
+        int(MILLION_PRIZE <= _amount < JACKPOT_PRIZE),
+        int(_amount >= JACKPOT_PRIZE),
+    )
+del _whites, _pb, _amount
+NO_MATCHES = (0, False)  # last_matches for the common no-match drawing
+
+def json_bytes(obj) -> bytes:
+    """Compact JSON encoding (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def numbers_mask(numbers: list[int]) -> int:
+    """Pack ball numbers into an int with bit n set for each number n."""
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+
+# int.bit_count() is Python 3.10+; Raspberry Pi OS Bullseye ships 3.9
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    def popcount(mask: int) -> int:
+        """Number of set bits in mask."""
+        return bin(mask).count("1")
+
+
+def mask_numbers(mask: int) -> list[int]:
+    """Inverse of numbers_mask: the set bits as a sorted list."""
+    numbers = []
+    while mask:
+        low = mask & -mask
+        numbers.append(low.bit_length() - 1)
+        mask ^= low
+    return numbers
+
+
+# dataclass(slots=True) is Python 3.10+ too - on 3.9 Player just keeps its __dict__
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**SLOTS)
 class Player:
     id: str
     name: str
@@ -43,18 +103,32 @@ class Player:
     winnings: int = 0
     million_plus_wins: int = 0
     jackpot_wins: int = 0
-    joined_at: datetime = field(default_factory=datetime.now)
+    joined_at: float = field(default_factory=time.monotonic)  # time.monotonic() at join
     last_matches: tuple[int, bool] = (0, False)  # (white_matches, pb_match)
     last_prize: int = 0
     best_white_matches: int = 0  # Track highest white ball matches ever
+    white_mask: int = field(default=0, init=False, repr=False)  # numbers as a bitmask
+    _elapsed_seconds: int = field(default=-1, init=False, repr=False)  # last formatted elapsed time...
+    _elapsed_text: str = field(default="", init=False, repr=False)  # ...and its text
 
-    def check_ticket(self, drawn_whites: list[int], drawn_pb: int) -> int:
-        """Check this player's numbers against drawn numbers. Returns prize amount."""
-        white_matches = len(set(self.numbers) & set(drawn_whites))
+    def __post_init__(self):
+        self.white_mask = numbers_mask(self.numbers)
+
+    def check_ticket(self, drawn_mask: int, drawn_pb: int) -> int:
+        """Check this player's numbers against a drawing (whites as a numbers_mask). Returns prize amount."""
+        matched_mask = self.white_mask & drawn_mask
         pb_match = self.powerball == drawn_pb
+        if not matched_mask and not pb_match:
+            # Most drawings match nothing: just pay for the ticket
+            self.tickets += 1
+            self.spent += TICKET_COST
+            self.last_matches = NO_MATCHES
+            self.last_prize = 0
+            return 0
+        white_matches = popcount(matched_mask)
         
         self.last_matches = (white_matches, pb_match)
-        prize = PRIZES.get((white_matches, pb_match), 0)
+        prize, million_win, jackpot_win = PRIZE_TABLE[white_matches][pb_match]
         self.last_prize = prize
         
         # Track best white ball matches
@@ -64,29 +138,34 @@ class Player:
         self.tickets += 1
         self.spent += TICKET_COST
         self.winnings += prize
-        
-        if prize >= 1_000_000 and prize < 1_800_000_000:
-            self.million_plus_wins += 1
-        elif prize >= 1_800_000_000:
-            self.jackpot_wins += 1
-            
+        self.million_plus_wins += million_win
+        self.jackpot_wins += jackpot_win
         return prize
 
-    def get_elapsed_time(self) -> str:
-        """Return formatted elapsed time since joining."""
-        delta = datetime.now() - self.joined_at
-        total_seconds = int(delta.total_seconds())
+    def get_elapsed_time(self, now: Optional[float] = None) -> str:
+        """Return formatted elapsed time since joining (re-formatted at most once a second).
+
+        now is a time.monotonic() reading, so a caller formatting several players reads the clock once.
+        """
+        if now is None:
+            now = time.monotonic()
+        total_seconds = int(now - self.joined_at)
+        if total_seconds == self._elapsed_seconds:
+            return self._elapsed_text
         hours, remainder = divmod(total_seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
         
         if hours > 0:
-            return f"{hours}h {minutes}m"
+            text = f"{hours}h {minutes}m"
         elif minutes > 0:
-            return f"{minutes}m {seconds}s"
+            text = f"{minutes}m {seconds}s"
         else:
-            return f"{seconds}s"
+            text = f"{seconds}s"
+        self._elapsed_seconds = total_seconds
+        self._elapsed_text = text
+        return text
 
-    def to_dict(self) -> dict:
+    def to_dict(self, now: Optional[float] = None) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -97,7 +176,7 @@ class Player:
             "winnings": self.winnings,
             "million_plus_wins": self.million_plus_wins,
             "jackpot_wins": self.jackpot_wins,
-            "elapsed_time": self.get_elapsed_time(),
+            "elapsed_time": self.get_elapsed_time(now),
             "last_matches": self.last_matches,
             "last_prize": self.last_prize,
             "best_white_matches": self.best_white_matches,
@@ -108,6 +187,10 @@ class Player:
 class GameState:
     def __init__(self):
         self.lock = threading.Lock()
+        # Drawings use their own generator; bound methods skip the attribute lookups per draw
+        self._rng = random.Random()
+        self._getrandbits = self._rng.getrandbits
+        self._randrange = self._rng.randrange
         self.players: dict[str, Player] = {}
         self.player_order: list[str] = []  # Maintain join order
         self.total_drawings: int = 0
@@ -127,6 +210,12 @@ class GameState:
         self.jackpot_winner_spent: int = 0
         self.jackpot_winner_time: str = ""
         self.jackpot_winner_tickets: int = 0
+        # Bumped on every change; get_state() reuses its last result until it moves
+        self.version: int = 0
+        self._state_cache: tuple = (None, None)  # ((version, second), state)
+        self._state_json: tuple = (None, b"")  # (state, its JSON encoding)
+        self._saved_version: int = -1  # version last written by save_state()
+        self._save_lock = threading.Lock()  # Autosave and shutdown saves share the temp file
 
     def add_player(self, name: str, numbers: list[int], powerball: int) -> tuple[bool, str]:
         """Add a new player. Returns (success, message/player_id)."""
@@ -157,6 +246,8 @@ class GameState:
             # Auto-start when first player joins
             if len(self.players) == 1:
                 self.running = True
+            # Only bumped once something changed, so rejected joins keep the caches
+            self.version += 1
                 
             return True, player_id
     
@@ -170,33 +261,41 @@ class GameState:
                 # Stop if no players left
                 if len(self.players) == 0:
                     self.running = False
+                self.version += 1
                 return True
             return False
     
     def reset_game(self):
         """Reset all game state."""
-        with self.lock:
-            self.players.clear()
-            self.player_order.clear()
-            self.total_drawings = 0
-            self.current_whites = []
-            self.current_powerball = 0
-            self.running = False
-            self.jackpot_hit = False
-            self.jackpot_winner = None
-            # Clear winner stats
-            self.jackpot_winner_spent = 0
-            self.jackpot_winner_time = ""
-            self.jackpot_winner_tickets = 0
-            # Keep jackpot history for the banner
+        # Hold _save_lock throughout, so an in-flight save can't put the old game back on disk
+        with self._save_lock:
+            with self.lock:
+                self.version += 1
+                self.players.clear()
+                self.player_order.clear()
+                self.total_drawings = 0
+                self.current_whites = []
+                self.current_powerball = 0
+                self.running = False
+                self.jackpot_hit = False
+                self.jackpot_winner = None
+                # Clear winner stats
+                self.jackpot_winner_spent = 0
+                self.jackpot_winner_time = ""
+                self.jackpot_winner_tickets = 0
+                # Keep jackpot history for the banner
+                version = self.version
 
-        # Delete state file to prevent reload of old state
-        if os.path.exists(STATE_FILE):
-            os.remove(STATE_FILE)
+            # Delete state file to prevent reload of old state
+            if os.path.exists(STATE_FILE):
+                os.remove(STATE_FILE)
+            # No state file is the saved form of a reset game
+            self._saved_version = version
 
     def resume_after_jackpot(self):
         """Resume game after jackpot celebration."""
         with self.lock:
+            self.version += 1
             self.jackpot_hit = False
             self.jackpot_winner = None
             if len(self.players) > 0:
@@ -205,68 +304,115 @@ class GameState:
     def clear_million_flash(self):
         """Clear the million dollar win flash flag (called by display after showing effect)."""
         with self.lock:
+            self.version += 1
             self.million_win_pending = False
 
     def set_speed(self, speed: int):
         """Set drawings per second (1, 10, 100, 1000, 10000)."""
         with self.lock:
+            self.version += 1
             self.speed = max(1, min(10000, speed))
     
-    def draw_numbers(self) -> tuple[list[int], int]:
-        """Draw new Powerball numbers."""
-        whites = sorted(random.sample(range(1, WHITE_BALL_MAX + 1), 5))
-        pb = random.randint(1, POWERBALL_MAX)
-        return whites, pb
+    def draw_numbers(self) -> tuple[int, int]:
+        """Draw new Powerball numbers: (white balls as a numbers_mask, powerball)."""
+        getrandbits = self._getrandbits
+        mask = 0
+        count = 0
+        while count < 5:
+            # Rejection sampling: 7 random bits cover 0-127, keep 1-69 not drawn yet
+            n = getrandbits(7)
+            if 0 < n <= WHITE_BALL_MAX and not mask >> n & 1:
+                mask |= 1 << n
+                count += 1
+        pb = self._randrange(1, POWERBALL_MAX + 1)
+        return mask, pb
     
     def run_drawing(self) -> dict:
         """Execute one drawing and check all players. Returns results."""
+        return self.run_drawings(1)
+
+    def run_drawings(self, n: int = 1) -> dict:
+        """Execute up to n drawings under a single lock (stops early on a jackpot).
+
+        Returns a summary of the batch and the last drawing's numbers; player stats
+        are read through get_state() at display rate instead.
+        """
         with self.lock:
             if not self.running or not self.players:
                 return {"active": False}
             
-            self.current_whites, self.current_powerball = self.draw_numbers()
-            self.total_drawings += 1
-            
+            players = [self.players[player_id] for player_id in self.player_order]
             results = {
                 "active": True,
-                "drawing_num": self.total_drawings,
-                "whites": self.current_whites,
-                "powerball": self.current_powerball,
-                "players": [],
+                "drawings": 0,
                 "jackpot_hit": False,
                 "jackpot_winner": None,
             }
             
-            for player_id in self.player_order:
-                player = self.players[player_id]
-                prize = player.check_ticket(self.current_whites, self.current_powerball)
+            for _ in range(n):
+                drawn_mask, powerball = self.draw_numbers()
+                self.total_drawings += 1
+                results["drawings"] += 1
                 
-                if prize >= 1_800_000_000:
-                    self.jackpot_hit = True
-                    self.jackpot_winner = player.name
-                    # Log jackpot history
-                    self.last_jackpot_rolls = self.total_drawings
-                    self.last_jackpot_winner = player.name
-                    # Capture winner stats for display
-                    self.jackpot_winner_spent = player.spent
-                    self.jackpot_winner_time = player.get_elapsed_time()
-                    self.jackpot_winner_tickets = player.tickets
-                    # Stop the game on jackpot
-                    self.running = False
-                    results["jackpot_hit"] = True
-                    results["jackpot_winner"] = player.name
-                elif prize >= 1_000_000:
-                    # Set flag for million dollar flash (display will clear it)
-                    self.million_win_pending = True
-
-                results["players"].append(player.to_dict())
+                for player in players:
+                    prize = player.check_ticket(drawn_mask, powerball)
+                    if prize < MILLION_PRIZE:
+                        continue
+                    
+                    if prize >= JACKPOT_PRIZE:
+                        self.jackpot_hit = True
+                        self.jackpot_winner = player.name
+                        # Log jackpot history
+                        self.last_jackpot_rolls = self.total_drawings
+                        self.last_jackpot_winner = player.name
+                        # Capture winner stats for display
+                        self.jackpot_winner_spent = player.spent
+                        self.jackpot_winner_time = player.get_elapsed_time()
+                        self.jackpot_winner_tickets = player.tickets
+                        # Stop the game on jackpot
+                        self.running = False
+                        results["jackpot_hit"] = True
+                        results["jackpot_winner"] = player.name
+                    else:
+                        # Set flag for million dollar flash (display will clear it)
+                        self.million_win_pending = True
+                
+                # Jackpot stops the game - leave its numbers on screen
+                if not self.running:
+                    break
             
+            # Only the last drawing is shown, so only it gets turned back into a list
+            self.current_whites = mask_numbers(drawn_mask)
+            self.current_powerball = powerball
+            # Bumped last, so get_state() keeps serving the previous snapshot during the batch
+            self.version += 1
+            results["drawing_num"] = self.total_drawings
+            results["whites"] = self.current_whites
+            results["powerball"] = powerball
             return results
     
+    def get_tick_info(self) -> tuple[bool, int, int]:
+        """(running, player_count, speed) - all the game loop needs to schedule drawings."""
+        with self.lock:
+            return self.running, len(self.players), self.speed
+
     def get_state(self) -> dict:
-        """Get current game state for display."""
+        """Get current game state for display.
+
+        The result is shared between callers until the game changes (or the elapsed
+        times tick over to the next second) - treat it as read-only.
+        Cache hits don't take the lock, so readers never wait on a batch of drawings.
+        """
+        # _state_cache is swapped as one tuple, so the key always matches its state
+        now = time.monotonic()
+        cached_key, cached_state = self._state_cache
+        if cached_key == (self.version, int(now)):
+            return cached_state
         with self.lock:
-            return {
+            key = (self.version, int(now))
+            if self._state_cache[0] == key:
+                return self._state_cache[1]
+            state = {
                 "running": self.running,
                 "total_drawings": self.total_drawings,
                 "current_whites": self.current_whites,
@@ -281,50 +427,75 @@ class GameState:
                 "jackpot_winner_time": self.jackpot_winner_time,
                 "jackpot_winner_tickets": self.jackpot_winner_tickets,
                 "million_win_pending": self.million_win_pending,
-                "players": [self.players[pid].to_dict() for pid in self.player_order],
+                "players": [self.players[pid].to_dict(now) for pid in self.player_order],
             }
+            self._state_cache = (key, state)
+            return state
+
+    def get_state_json(self) -> bytes:
+        """get_state() as JSON bytes, re-encoded only when get_state() returns a new snapshot."""
+        state = self.get_state()
+        cached_state, data = self._state_json
+        if cached_state is state:
+            return data
+        data = json_bytes(state)
+        self._state_json = (state, data)
+        return data
 
-    @staticmethod
-    def quick_pick() -> tuple[list[int], int]:
+    def quick_pick(self) -> tuple[list[int], int]:
         """Generate random numbers for quick pick."""
-        whites = sorted(random.sample(range(1, WHITE_BALL_MAX + 1), 5))
-        pb = random.randint(1, POWERBALL_MAX)
+        whites = sorted(self._rng.sample(WHITE_BALLS, 5))
+        pb = self._randrange(1, POWERBALL_MAX + 1)
         return whites, pb
 
-    def save_state(self, filepath: str = STATE_FILE) -> bool:
-        """Save game state to JSON file for persistence across restarts."""
-        with self.lock:
+    def save_state(self, filepath: str = STATE_FILE, force: bool = False) -> bool:
+        """Save game state to JSON file for persistence across restarts.
+
+        Skipped when nothing has changed since the last save, unless force is set.
+        """
+        with self._save_lock:
             try:
-                state_data = {
-                    "saved_at": datetime.now().isoformat(),
-                    "total_drawings": self.total_drawings,
-                    "speed": self.speed,
-                    "last_jackpot_rolls": self.last_jackpot_rolls,
-                    "last_jackpot_winner": self.last_jackpot_winner,
-                    "player_order": self.player_order,
-                    "players": []
-                }
-
-                for pid in self.player_order:
-                    player = self.players[pid]
-                    # Calculate elapsed seconds to restore later
-                    elapsed_seconds = (datetime.now() - player.joined_at).total_seconds()
-                    state_data["players"].append({
-                        "id": player.id,
-                        "name": player.name,
-                        "numbers": player.numbers,
-                        "powerball": player.powerball,
-                        "tickets": player.tickets,
-                        "spent": player.spent,
-                        "winnings": player.winnings,
-                        "million_plus_wins": player.million_plus_wins,
-                        "jackpot_wins": player.jackpot_wins,
-                        "elapsed_seconds": elapsed_seconds,
-                        "best_white_matches": player.best_white_matches,
-                    })
-
-                with open(filepath, "w") as f:
-                    json.dump(state_data, f, indent=2)
+                with self.lock:
+                    if not force and self.version == self._saved_version:
+                        return True
+                    version = self.version
+                    state_data = {
+                        "saved_at": datetime.now().isoformat(),
+                        "total_drawings": self.total_drawings,
+                        "speed": self.speed,
+                        "last_jackpot_rolls": self.last_jackpot_rolls,
+                        "last_jackpot_winner": self.last_jackpot_winner,
+                        "player_order": list(self.player_order),
+                        "players": []
+                    }
+
+                    now = time.monotonic()
+                    for pid in self.player_order:
+                        player = self.players[pid]
+                        # Calculate elapsed seconds to restore later
+                        elapsed_seconds = now - player.joined_at
+                        state_data["players"].append({
+                            "id": player.id,
+                            "name": player.name,
+                            "numbers": player.numbers,
+                            "powerball": player.powerball,
+                            "tickets": player.tickets,
+                            "spent": player.spent,
+                            "winnings": player.winnings,
+                            "million_plus_wins": player.million_plus_wins,
+                            "jackpot_wins": player.jackpot_wins,
+                            "elapsed_seconds": elapsed_seconds,
+                            "best_white_matches": player.best_white_matches,
+                        })
+
+                # Serialize and write outside the lock so drawings aren't held up
+                data = json_bytes(state_data)
+                # Write to a temp file and swap it in, so a crash mid-write can't corrupt the save
+                tmp_path = filepath + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, filepath)
+                self._saved_version = version
                 print(f"State saved to {filepath}")
                 return True
             except Exception as e:
@@ -338,6 +509,7 @@ class GameState:
             return False
 
         with self.lock:
+            self.version += 1
             try:
                 with open(filepath, "r") as f:
                     state_data = json.load(f)
@@ -355,7 +527,7 @@ class GameState:
                 for pdata in state_data.get("players", []):
                     # Calculate joined_at by subtracting elapsed time from now
                     elapsed_seconds = pdata.get("elapsed_seconds", 0)
-                    joined_at = datetime.now() - timedelta(seconds=elapsed_seconds)
+                    joined_at = time.monotonic() - elapsed_seconds
 
                     player = Player(
                         id=pdata["id"],
@@ -377,6 +549,7 @@ class GameState:
                 if len(self.players) > 0:
                     self.running = True
 
+                self._saved_version = self.version
                 saved_at = state_data.get("saved_at", "unknown")
                 print(f"State restored from {filepath} (saved: {saved_at})")
                 print(f"  - {len(self.players)} players, {self.total_drawings:,} drawings")
@@ -15,12 +15,13 @@ from server import run_server
 
 # Global for clean shutdown
 shutdown_requested = False
+AUTO_SAVE_INTERVAL = 60  # Save state every 60 seconds
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     global shutdown_requested
     print(f"\nReceived signal {signum}, saving state and shutting down...")
-    game.save_state()
+    game.save_state(force=True)
     shutdown_requested = True
 
 
@@ -40,46 +41,34 @@ def get_local_ip():
 def game_loop(display):
     """Main game loop - runs drawings and updates display."""
     global shutdown_requested
-    last_draw_time = time.time()
-    last_save_time = time.time()
-    draws_this_second = 0
-    AUTO_SAVE_INTERVAL = 60  # Save state every 60 seconds
+    next_deadline = time.monotonic()
 
     while not shutdown_requested:
-        state = game.get_state()
-
-        # Run drawings based on speed setting
-        if state["running"] and state["player_count"] > 0:
-            current_time = time.time()
-            elapsed = current_time - last_draw_time
-
-            # Calculate how many draws we should do
-            target_draws = int(elapsed * state["speed"])
-
-            if target_draws > draws_this_second:
-                # Batch draws for high speeds
-                draws_to_do = min(target_draws - draws_this_second, state["speed"])
-                for _ in range(draws_to_do):
-                    game.run_drawing()
-                draws_this_second += draws_to_do
-
-            # Reset counter each second
-            if elapsed >= 1.0:
-                last_draw_time = current_time
-                draws_this_second = 0
-
-        # Auto-save periodically (if there are players)
-        if state["player_count"] > 0:
-            if time.time() - last_save_time >= AUTO_SAVE_INTERVAL:
-                game.save_state()
-                last_save_time = time.time()
-
-        # Update display (always runs at ~30fps)
+        running, player_count, speed = game.get_tick_info()
+
+        # Run every drawing that has come due since the last frame
+        if running and player_count > 0:
+            now = time.monotonic()
+            if now >= next_deadline:
+                draws_to_do = min(int((now - next_deadline) * speed) + 1, speed)
+                game.run_drawings(draws_to_do)
+                # Don't build up more than a second of backlog after a stall
+                next_deadline = max(next_deadline + draws_to_do / speed, now - 1.0)
+        else:
+            next_deadline = time.monotonic()
+
+        # Update display - its frame clock (~30fps, less when idle) paces the loop
         if not display.update(game.get_state()):
             break
 
-        # Small sleep to prevent CPU spinning
-        time.sleep(0.01)
+
+def autosave_loop():
+    """Save state periodically on its own thread so saves never stall drawings."""
+    while not shutdown_requested:
+        time.sleep(AUTO_SAVE_INTERVAL)
+        # Auto-save only if there are players
+        if not shutdown_requested and game.get_tick_info()[1] > 0:
+            game.save_state()
 
 
 def main():
@@ -114,6 +103,9 @@ def main():
     )
     server_thread.start()
 
+    # Start periodic auto-save in background thread
+    threading.Thread(target=autosave_loop, daemon=True).start()
+
     # Give server a moment to start
     time.sleep(1)
 
@@ -127,7 +119,7 @@ def main():
     finally:
         # Save state on exit
         print("Saving state before exit...")
-        game.save_state()
+        game.save_state(force=True)
         display.quit()
         print("Goodbye!")
 
@@ -26,29 +26,28 @@ def get_local_ip():
 
 def game_loop():
     """Main game loop - runs drawings without display."""
-    last_draw_time = time.time()
-    draws_this_second = 0
+    POLL_INTERVAL = 0.1  # Longest sleep, so speed/start/stop changes are picked up
+    next_deadline = time.monotonic()
     
     while True:
-        state = game.get_state()
+        running, player_count, speed = game.get_tick_info()
+        now = time.monotonic()
         
-        if state["running"] and state["player_count"] > 0:
-            current_time = time.time()
-            elapsed = current_time - last_draw_time
-            
-            target_draws = int(elapsed * state["speed"])
-            
-            if target_draws > draws_this_second:
-                draws_to_do = min(target_draws - draws_this_second, state["speed"])
-                for _ in range(draws_to_do):
-                    game.run_drawing()
-                draws_this_second += draws_to_do
-            
-            if elapsed >= 1.0:
-                last_draw_time = current_time
-                draws_this_second = 0
+        if not (running and player_count > 0):
+            next_deadline = now
+            time.sleep(POLL_INTERVAL)
+            continue
         
-        time.sleep(0.01)
+        if now < next_deadline:
+            # Nothing due yet - sleep until the next batch instead of polling
+            time.sleep(min(next_deadline - now, POLL_INTERVAL))
+            continue
+        
+        # Batch draws so high speeds need at most ~100 wakeups per second
+        batch_size = max(1, speed // 100)
+        game.run_drawings(batch_size)
+        # Don't build up more than a second of backlog after a stall
+        next_deadline = max(next_deadline + batch_size / speed, now - 1.0)
 
 
 def main():
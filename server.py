@@ -3,7 +3,7 @@ Powerball Simulator - Web Server
 Flask + SocketIO server for player registration and admin controls.
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response
 from flask_socketio import SocketIO, emit
 from game_engine import game, WHITE_BALL_MAX, POWERBALL_MAX
 
@@ -72,7 +72,7 @@ def quick_pick():
 @app.route('/api/state', methods=['GET'])
 def get_state():
     """Get current game state."""
-    return jsonify(game.get_state())
+    return Response(game.get_state_json(), mimetype='application/json')
 
 
 @app.route('/api/admin/remove', methods=['POST'])
@@ -0,0 +1,146 @@
+async function api(endpoint, data = {}) {
+    try {
+        const resp = await fetch('/api/' + endpoint, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(data)
+        });
+        return await resp.json();
+    } catch (e) {
+        return {success: false, error: e.message};
+    }
+}
+
+async function gitStatus() {
+    await api('git_status');
+}
+
+async function gitPull() {
+    await api('git_pull');
+}
+
+async function gitCommitPush() {
+    const msg = document.getElementById('commitMsg').value || 'Update from dev panel';
+    await api('git_commit_push', {message: msg});
+    document.getElementById('commitMsg').value = '';
+}
+
+async function piPull() {
+    await api('pi_pull');
+}
+
+async function piRestart() {
+    await api('pi_restart');
+}
+
+async function piStatus() {
+    const result = await api('pi_status');
+    const el = document.getElementById('piStatus');
+    if (result.output && result.output.includes('powerball')) {
+        el.innerHTML = '<span class="status-indicator status-running"></span> App running';
+    } else {
+        el.innerHTML = '<span class="status-indicator status-stopped"></span> App not detected';
+    }
+}
+
+async function quickDeploy() {
+    const statusEl = document.getElementById('deployStatus');
+    statusEl.className = 'deploy-status active';
+    statusEl.textContent = 'Deploying...';
+
+    const msg = document.getElementById('commitMsg').value || 'Deploy from dev panel';
+    let result = await api('quick_deploy', {message: msg});
+    document.getElementById('commitMsg').value = '';
+
+    // Deploy runs in the background - poll until it finishes (logs stream live meanwhile)
+    while (result.deploy_id) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        try {
+            const resp = await fetch('/api/deploy_status/' + result.deploy_id);
+            const status = await resp.json();
+            if (status.done) {
+                result = status;
+            } else if (status.error) {
+                result = {success: false, error: status.error};
+            }
+        } catch (e) {
+            // Keep polling through transient network errors
+        }
+    }
+
+    if (result.success) {
+        statusEl.textContent = 'Deploy complete!';
+        setTimeout(() => { statusEl.className = 'deploy-status'; }, 3000);
+    } else {
+        statusEl.textContent = 'Deploy failed - check logs';
+        statusEl.style.borderColor = '#dc3545';
+        statusEl.style.color = '#dc3545';
+    }
+}
+
+async function runSshCmd() {
+    const cmd = document.getElementById('sshCmd').value;
+    if (!cmd) return;
+    await api('ssh_command', {command: cmd});
+}
+
+let logsEtag = null;
+let lastLogId = 0;
+
+async function refreshLogs() {
+    let resp;
+    try {
+        resp = await fetch('/api/logs_html?since=' + lastLogId, {
+            headers: logsEtag ? {'If-None-Match': logsEtag} : {}
+        });
+    } catch (e) {
+        return;
+    }
+    if (resp.status === 304) return;
+    logsEtag = resp.headers.get('ETag');
+    showLogs(await resp.text(), resp.headers.get('X-Logs-Full') === '1');
+    lastLogId = parseInt(resp.headers.get('X-Logs-Version'), 10);
+}
+
+function showLogs(html, replace) {
+    const container = document.getElementById('logContainer');
+    if (replace) {
+        container.innerHTML = html;
+    } else {
+        container.insertAdjacentHTML('beforeend', html);
+        while (container.children.length > 100) {
+            container.removeChild(container.firstChild);
+        }
+    }
+    container.scrollTop = container.scrollHeight;
+}
+
+function clearLogs() {
+    api('clear_logs');
+    document.getElementById('logContainer').innerHTML = '';
+}
+
+function pollLogs() {
+    refreshLogs();
+    setInterval(refreshLogs, 5000);
+}
+
+// Live log updates pushed from the server (poll if SSE is unavailable, or the
+// server turned the stream away because too many are open)
+if (window.EventSource) {
+    const logStream = new EventSource('/api/logs/stream');
+    logStream.addEventListener('reset', e => {
+        showLogs(e.data, true);
+        lastLogId = parseInt(e.lastEventId, 10);
+    });
+    logStream.onmessage = e => {
+        showLogs(e.data, false);
+        lastLogId = parseInt(e.lastEventId, 10);
+    };
+    logStream.onerror = () => {
+        // Network drops reconnect by themselves; a refused stream (503) closes for good
+        if (logStream.readyState === EventSource.CLOSED) pollLogs();
+    };
+} else {
+    pollLogs();
+}